@@ -95,9 +95,11 @@ def batch_performance_evaluation(params, synthesizer=None, iter_train=None, iter
     return e_roc_t, e_apr_t, e_roc_s, e_apr_s, elapsed_time
 
 
-def learning_curve(params, synthesizer=RNASynthesizerInitializer().synthesizer):
+def learning_curve(params, synthesizer=None):
     """
     """
+    if synthesizer is None:
+        synthesizer = RNASynthesizerInitializer().synthesizer
     rfam_id = params['rfam_id']
     train_to_test_split_ratio = params['train_to_test_split_ratio']
 
@@ -113,7 +115,7 @@ def learning_curve(params, synthesizer=RNASynthesizerInitializer().synthesizer):
 
     data_fractions = list(np.linspace(
         data_fraction_lower_bound, data_fraction_upper_bound, data_fraction_chunks))
-    print data_fractions
+    print(data_fractions)
     lc_start_time = time.time()
     logger.info('Starting RNA Synthesis experiment for %s ...' % rfam_id)
 
@@ -155,8 +157,8 @@ def learning_curve(params, synthesizer=RNASynthesizerInitializer().synthesizer):
         roc_s.append(mrocs)
         apr_t.append(maprt)
         apr_s.append(maprs)
-	lc_time_lapse = time.time() - lc_start_time
-	logger.info('Learning curve experiment took %f seconds to complete:' % lc_time_lapse)
+        lc_time_lapse = time.time() - lc_start_time
+        logger.info('Learning curve experiment took %f seconds to complete:' % lc_time_lapse)
     return roc_t, roc_s, apr_t, apr_s, data_fractions
 
 
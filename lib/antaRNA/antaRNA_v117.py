@@ -26,7 +26,7 @@ def parseGC(string):
     """
     m = re.match('^\s*(\d+\.\d+):?(\d+)?\s*?-?\s*?(\d+)?\s*?$', string)
     if m is None:
-        print "'" + string + "' is not a valid input for tGC Expected forms like '0-5'."
+        print("'" + string + "' is not a valid input for tGC Expected forms like '0-5'.")
         exit(1)
     tGC = float(m.group(1))
     if m.group(2) and m.group(3):
@@ -171,28 +171,28 @@ def getLP(BPSTACK):
     # getting single base pairs
     stack = {}
     LP = {}
-    if type(BPSTACK[random.choice(BPSTACK.keys())]) == types.TupleType:
-        for i in BPSTACK.keys():
+    if type(BPSTACK[random.choice(list(BPSTACK.keys()))]) == tuple:
+        for i in list(BPSTACK.keys()):
             # if str(BPSTACK[i][1][0]) not in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
             stack[i] = int(BPSTACK[i][1][0])
         # print i , BPSTACK[i][1][0]
     else:
-        for i in BPSTACK.keys():
+        for i in list(BPSTACK.keys()):
             # if str(BPSTACK[i]) not in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
             stack[i] = BPSTACK[i]
 
     # removing redundant base pair indices
-    for i in stack.keys():
+    for i in list(stack.keys()):
         if i >= stack[i]:
             del stack[i]
 
     # actual checking for single lonley base pairs
-    for i in stack.keys():
+    for i in list(stack.keys()):
         if not (i - 1 in stack and stack[i - 1] == stack[i] + 1) and not (i + 1 in stack and stack[i + 1] == stack[i] - 1):
             LP[i] = stack[i]
 
     # actual removal of 2er lonley base pairs
-    for i in stack.keys():
+    for i in list(stack.keys()):
         if not (i - 1 in stack and stack[i - 1] == stack[i] + 1) and (i + 1 in stack and stack[i + 1] == stack[i] - 1) and not (i + 2 in stack and stack[i + 2] == stack[i] - 2):
             LP[i] = stack[i]
             LP[i + 1] = stack[i + 1]
@@ -205,7 +205,7 @@ def getBPStack(structure, sequence):
     """
     tmp_stack = {"()": [], "{}": [], "[]": [], "<>": []}
     BPstack = {}
-    for i in xrange(len(structure)):
+    for i in range(len(structure)):
 
         # REGULAR SECONDARY STRUCTURE DETECTION
         if structure[i] in "(){}[]<>":
@@ -250,7 +250,7 @@ def getbpStack(structure):
     tmp_stack = {"()": [], "{}": [], "[]": [], "<>": []}
     bpstack = {}
 
-    for i in xrange(len(structure)):
+    for i in range(len(structure)):
         if structure[i] in "(){}[]<>":
 
             no = 0
@@ -358,7 +358,7 @@ def initTerrain(args):
     args.terrain = {}
     pathlength = 1
     pheromone = 1
-    for p in xrange(len(args.Cstr)):
+    for p in range(len(args.Cstr)):
         if p == 0:
             for i in nt:
                 args.terrain["%s.%s" % (p, i)] = (pheromone, pathlength)
@@ -455,17 +455,17 @@ def printTerrain(terrain):
     for a, i in enumerate(sorted(terrain.keys())):
         # print a
         if i.split(".")[0] != tmp_i:
-            print "\nElements:", tmp_c, "\n#########################\n", i, terrain[i]
+            print("\nElements:", tmp_c, "\n#########################\n", i, terrain[i])
 
             tmp_c = 1
             tmp_i = i.split(".")[0]
         else:
-            print i, terrain[i]
+            print(i, terrain[i])
             tmp_c += 1
 
-    print "\nElements:", tmp_c
-    print "#########################"
-    print len(terrain)
+    print("\nElements:", tmp_c)
+    print("#########################")
+    print(len(terrain))
 
 ########################################
 # SEQUENCE ASSEMBLY a.k.a. The ANTWALK
@@ -482,7 +482,7 @@ def pickStep(tmp_steps, summe):
     else:
         rand = random.random()  # draw random number
         mainval = 0
-        for choice in xrange(len(tmp_steps)):
+        for choice in range(len(tmp_steps)):
             val, label = tmp_steps[choice]
             mainval += val / float(summe)
             if mainval > rand:  # as soon, as the mainval gets larger than the random value the assignment is done
@@ -531,7 +531,7 @@ def getPathFromSelection(args, RNAfold, RNAfold_pattern):
             Returns the winning path from a selection of pathes...
     """
     win_path = 0
-    for i in xrange(args.ants_per_selection):
+    for i in range(args.ants_per_selection):
         # Generate Sequence
         sequence = getPath(args)
         # Measure sequence features and transform them into singular distances
@@ -568,7 +568,8 @@ def getPKStructure(sequence, args):
                          stdin=subprocess.PIPE,
                          stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE,
-                         close_fds=True)
+                         close_fds=True,
+                         universal_newlines=True)
 
     # get linewise stdout output
     pKiss_output = p.stdout.read().split("\n")
@@ -578,11 +579,11 @@ def getPKStructure(sequence, args):
     if (len(pKiss_output) > 1):
         structure = "".join(pKiss_output[1].split(" ")[3])
     else:
-        print "DEBUG getPKStructure() : call stdout ="
-        print pKiss_output
-        print "DEBUG getPKStructure() : call stderr ="
-        print p.stderr.read()
-        print "DEBUG END (empty structure returned)"
+        print("DEBUG getPKStructure() : call stdout =")
+        print(pKiss_output)
+        print("DEBUG getPKStructure() : call stderr =")
+        print(p.stderr.read())
+        print("DEBUG END (empty structure returned)")
         # close subprocess handle
         p.communicate()
         exit(-1)
@@ -604,7 +605,8 @@ def getIPKnotStructure(sequence):
                          stdin=subprocess.PIPE,
                          stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE,
-                         close_fds=False)
+                         close_fds=False,
+                         universal_newlines=True)
     IPKnot_output = p.stdout.read().split("\n")
     # init with empty sequence
     structure = "." * len(sequence)
@@ -612,11 +614,11 @@ def getIPKnotStructure(sequence):
         # print IPKnot_output
         structure = IPKnot_output[2]
     else:
-        print "DEBUG getHKStructure() : call stdout ="
-        print IPKnot_output
-        print "DEBUG getHKStructure() : call stderr ="
-        print p.stderr.read()
-        print "DEBUG END (empty structure returned)"
+        print("DEBUG getHKStructure() : call stdout =")
+        print(IPKnot_output)
+        print("DEBUG getHKStructure() : call stderr =")
+        print(p.stderr.read())
+        print("DEBUG END (empty structure returned)")
         # close subprocess handle
         p.communicate()
         exit(-1)
@@ -637,7 +639,8 @@ def getHKStructure(sequence, args):
                          stdin=subprocess.PIPE,
                          stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE,
-                         close_fds=False)
+                         close_fds=False,
+                         universal_newlines=True)
 
     HotKnots_output = p.stdout.read().split("\n")
 
@@ -647,11 +650,11 @@ def getHKStructure(sequence, args):
         structure = "".join(HotKnots_output[2].replace(
             " ", "#").replace("##", "#").split("#")[1].split("\t")[0])
     else:
-        print "DEBUG getHKStructure() : call stdout ="
-        print HotKnots_output
-        print "DEBUG getHKStructure() : call stderr ="
-        print p.stderr.read()
-        print "DEBUG END (empty structure returned)"
+        print("DEBUG getHKStructure() : call stdout =")
+        print(HotKnots_output)
+        print("DEBUG getHKStructure() : call stderr =")
+        print(p.stderr.read())
+        print("DEBUG END (empty structure returned)")
         # close subprocess handle
         p.communicate()
         exit(-1)
@@ -675,7 +678,9 @@ def init_RNAfold(version, temperature, paramFile=""):
                          stdin=subprocess.PIPE,
                          stdout=subprocess.PIPE,
                          stderr=subprocess.PIPE,
-                         close_fds=True)
+                         close_fds=True,
+                         universal_newlines=True,
+                         bufsize=1)
     return p
 
 
@@ -685,7 +690,7 @@ def consult_RNAfold(seq, p):
     """
     p.stdin.write(seq + '\n')
     out = ""
-    for i in xrange(2):
+    for i in range(2):
         out += p.stdout.readline()
     return out
 
@@ -737,12 +742,12 @@ def getBPDifferenceDistance(stack1, stack2):
             Based on the not identical amount of base pairs within both structure stacks
     """
     d = 0
-    for i in stack1.keys():
+    for i in list(stack1.keys()):
         # check base pairs in stack 1
         if i < stack1[i] and stack1[i] != stack2[i]:
             d += 1
         # check base pairs in stack 2
-    for i in stack2.keys():
+    for i in list(stack2.keys()):
         if i < stack2[i] and stack1[i] != stack2[i]:
             d += 1
     return d
@@ -911,7 +916,7 @@ def getSequenceEditDistance(SC, path):
     IUPAC = {"A": "A", "C": "C", "G": "G", "U": "U", "R": "AG", "Y": "CU", "S": "GC", "W": "AU",
              "K": "GU", "M": "AC", "B": "CGU", "D": "AGU", "H": "ACU", "V": "ACG", "N": "ACGU"}
     edit = 0
-    for i in xrange(len(SC)):
+    for i in range(len(SC)):
         if path[i] not in IUPAC[SC[i].upper()]:
             edit += 1
     return edit / float(len(path))
@@ -944,7 +949,7 @@ def trailBlaze(sequence, current_structure, ds, dgc, dseq, args):
 
     transitions = getTransitions(sequence)
 
-    for trans in xrange(len(transitions)):  # for each transition in the path
+    for trans in range(len(transitions)):  # for each transition in the path
         id1 = int(transitions[trans].split(".")[0])
         # getting requested  position id2
         tar_id2 = int(args.BPstack[id1][1][0])
@@ -969,7 +974,7 @@ def getTransitions(p):
             Retreive transitions of a specific path/sequence
     """
     transitions = []
-    for pos in xrange(len(p)):
+    for pos in range(len(p)):
         if pos == 0:
             transitions.append(str(pos) + "." + p[pos])
 
@@ -1055,36 +1060,36 @@ def exe():
         fromfile_prefix_chars='@',
         description="""
     
-	#########################################################################
-	#       antaRNA - ant assembled RNA                                     #
-	#       -> Ant Colony Optimized RNA Sequence Design                     #
-	#       ------------------------------------------------------------    #
-	#       Robert Kleinkauf (c) 2015                                       #
-	#       Bioinformatics, Albert-Ludwigs University Freiburg, Germany     #
-	#########################################################################
+        #########################################################################
+        #       antaRNA - ant assembled RNA                                     #
+        #       -> Ant Colony Optimized RNA Sequence Design                     #
+        #       ------------------------------------------------------------    #
+        #       Robert Kleinkauf (c) 2015                                       #
+        #       Bioinformatics, Albert-Ludwigs University Freiburg, Germany     #
+        #########################################################################
   
-	- For antaRNA only the VIENNNA RNA Package must be installed on your linux system.
-	  antaRNA will only check, if the executables of RNAfold  of the ViennaRNA package can be found. If those programs are 
-	  not installed correctly, no output will be generated, an also no warning will be prompted.
-	  So the binary path of the Vienna Tools must be set up correctly in your system's PATH variable in order to run antaRNA correctly!
-	- If you want to use the pseudoknot functionality, pKiss_mfe of the RNAshapes studio OR HotKnots OR IPKnot must be installed and callable as standalone in order to execute antaRNA.
+        - For antaRNA only the VIENNNA RNA Package must be installed on your linux system.
+          antaRNA will only check, if the executables of RNAfold  of the ViennaRNA package can be found. If those programs are 
+          not installed correctly, no output will be generated, an also no warning will be prompted.
+          So the binary path of the Vienna Tools must be set up correctly in your system's PATH variable in order to run antaRNA correctly!
+        - If you want to use the pseudoknot functionality, pKiss_mfe of the RNAshapes studio OR HotKnots OR IPKnot must be installed and callable as standalone in order to execute antaRNA.
     
     - antaRNA was only tested under Linux.
     
     - For questions and remarks please feel free to contact us at http://www.bioinf.uni-freiburg.de/
-	
-	""",
+        
+        """,
 
         epilog="""   
-	Example calls:
-		python antaRNA_vXY.py -Cstr "...(((...)))..." -tGC 0.5 -n 2 -v
-		python antaRNA_vXY.py -Cstr ".........aaa(((...)))aaa........." -tGC 0.5 -n 10 --output_file /path/to/antaRNA_TESTRUN -v
-		python antaRNA_vXY.py -Cstr "BBBBB....AAA(((...)))AAA....BBBBB" -Cseq "NNNNANNNNNCNNNNNNNNNNNGNNNNNNUNNN" --tGC 0.5 -n 10
-
-	#########################################################################
-	#       --- Hail to the Queen!!! All power to the swarm!!! ---          #
-	#########################################################################
-		""",
+        Example calls:
+                python antaRNA_vXY.py -Cstr "...(((...)))..." -tGC 0.5 -n 2 -v
+                python antaRNA_vXY.py -Cstr ".........aaa(((...)))aaa........." -tGC 0.5 -n 10 --output_file /path/to/antaRNA_TESTRUN -v
+                python antaRNA_vXY.py -Cstr "BBBBB....AAA(((...)))AAA....BBBBB" -Cseq "NNNNANNNNNCNNNNNNNNNNNGNNNNNNUNNN" --tGC 0.5 -n 10
+
+        #########################################################################
+        #       --- Hail to the Queen!!! All power to the swarm!!! ---          #
+        #########################################################################
+                """,
         formatter_class=RawTextHelpFormatter
     )
 
@@ -1275,7 +1280,7 @@ def exe():
     if hill.params.error == "0":
         hill.swarm()
     else:
-        print hill.params.error
+        print(hill.params.error)
 
 
 #########################
@@ -1309,7 +1314,7 @@ class AntHill:
             213, self.params.temperature, self.params.paramFile)
         RNAfold_pattern = re.compile('.+\n([.()]+)\s.+')
 
-        for n in xrange(self.params.noOfColonies):
+        for n in range(self.params.noOfColonies):
             start_time = time.time()
 
             # INITIALIZATION OF Vienna RNAfold
@@ -1401,14 +1406,14 @@ class AntHill:
                         best_solution_local = curr_solution
 
                 if self.params.verbose:
-                    print "SCORE " + str(Dscore) + " Resets " + str(resets) + " #Ant " + str(global_ant_count) + " out of " + str(self.params.ants_per_selection) + " cc " + str(convergence_counter)
+                    print("SCORE " + str(Dscore) + " Resets " + str(resets) + " #Ant " + str(global_ant_count) + " out of " + str(self.params.ants_per_selection) + " cc " + str(convergence_counter))
 
-                    print self.params.Cstr, " <- target struct"
-                    print best_solution[0], " <- BS since ", str(best_solution_since), "Size of Terrrain:", len(self.params.terrain)
-                    print best_solution[1], " <- BS Dscore " + str(best_solution[2]) + " ds " + str(best_solution[3]) + " dGC " + str(best_solution[4]) + " dseq " + str(best_solution[5]) + " LP " + str(len(self.params.LP)) + " <- best solution stats"
-                    print curr_structure, " <- CS"
-                    print sequence,
-                    print " <- CS", "Dscore", str(Dscore), "ds", ds, "dGC", dGC, "GC", getGC(sequence) * 100, "Dseq", dseq
+                    print(self.params.Cstr, " <- target struct")
+                    print(best_solution[0], " <- BS since ", str(best_solution_since), "Size of Terrrain:", len(self.params.terrain))
+                    print(best_solution[1], " <- BS Dscore " + str(best_solution[2]) + " ds " + str(best_solution[3]) + " dGC " + str(best_solution[4]) + " dseq " + str(best_solution[5]) + " LP " + str(len(self.params.LP)) + " <- best solution stats")
+                    print(curr_structure, " <- CS")
+                    print(sequence, end=' ')
+                    print(" <- CS", "Dscore", str(Dscore), "ds", ds, "dGC", dGC, "GC", getGC(sequence) * 100, "Dseq", dseq)
 
                 # UPDATING THE TERRAIN ACCORDING TO THE QUALITY OF THE CURRENT
                 # BESTO-OUT-OF-k SOLUTION
@@ -1416,7 +1421,7 @@ class AntHill:
                               ds, dGC, dseq, self.params)
 
                 if self.params.verbose:
-                    print "Used time for one iteration", time.time() - iteration_start
+                    print("Used time for one iteration", time.time() - iteration_start)
 
                 # CONVERGENCE AND TERMINATION CRITERION MANAGEMENT
                 if inConvergenceCorridor(curr_solution[3], curr_solution[4], curr_solution[5], best_solution_local[3], best_solution_local[4], best_solution_local[5]):
@@ -1538,12 +1543,12 @@ class AntHill:
                 if len(self.tmp_result) > 2:
                     struct = self.tmp_result.pop()
                     seq = self.tmp_result.pop()
-                    print "|".join(self.tmp_result)
-                    print seq
-                    print struct
+                    print("|".join(self.tmp_result))
+                    print(seq)
+                    print(struct)
                 else:
                     for i, entry in enumerate(self.tmp_result):
-                        print entry.replace("Rseq:", "")
+                        print(entry.replace("Rseq:", ""))
             else:
                 if col == 0:
                     print2file(self.params.output_file,
@@ -1680,7 +1685,7 @@ class Variables:
         """
         for bracket in ["()", "[]", "{}", "<>"]:
             counter = 0
-            for a in xrange(len(self.Cstr)):
+            for a in range(len(self.Cstr)):
                 if self.Cstr[a] in bracket[0]:
                     counter += 1
                 elif self.Cstr[a] in bracket[1]:
@@ -1697,7 +1702,7 @@ class Variables:
         for bracket in ["()", "[]", "{}", "<>"]:
             last_opening_char = 0
             tmp_check = 0
-            for a in xrange(len(self.Cstr)):
+            for a in range(len(self.Cstr)):
                 if self.Cstr[a] == bracket[0]:
                     last_opening_char = a
                     tmp_check = 1
@@ -1744,50 +1749,50 @@ class Variables:
             self.Cseq = "N" * len(self.Cstr)
 
         self.parse_GC_management()
-	if self.error != "0":
-	  
-	  self.checkForViennaTools()
-	  self.usedProgram = "RNAfold"
-	  if self.pseudoknots:
-	      if self.pkprogram == "pKiss":
-		  self.checkForpKiss()
-		  if self.pkparameter == True:
-		      self.alpha = 1.0
-		      self.beta = 0.1
-		      self.ER = 0.2
-		      self.Cstrweight = 0.1
-		      self.Cgcweight = 1.0
-		      self.Cseqweight = 0.5
-		      self.Cseqweight = 50
-		      self.ConvergenceCount = 100
-		      self.usedProgram = "pKiss"
-	      elif self.pkprogram == "HotKnots" and self.HotKnots_PATH != "":
-		  self.checkForHotKnots(args)
-		  if self.pkparameter == True:
-		      self.alpha = 1.0
-		      self.beta = 0.1
-		      self.ER = 0.2
-		      self.Cstrweight = 0.1
-		      self.Cgcweight = 1.0
-		      self.Cseqweight = 0.5
-		      self.Cseqweight = 50
-		      self.ConvergenceCount = 100
-		      self.usedProgram = "HotKnots"
-	      elif self.pkprogram == "IPKnot":
-		  self.checkForIPKnot()
-		  if self.pkparameter == True:
-		      self.alpha = 1.0
-		      self.beta = 0.1
-		      self.ER = 0.2
-		      self.Cstrweight = 0.1
-		      self.Cgcweight = 1.0
-		      self.Cseqweight = 0.5
-		      self.Cseqweight = 50
-		      self.ConvergenceCount = 100
-		      self.usedProgram = "IPKnot"
-	      else:
-		  error = " Please choose a suitable pseudoknot predictor: [pKiss|Hotknots|IPKnot]"
-		  self.error = error
+        if self.error != "0":
+          
+          self.checkForViennaTools()
+          self.usedProgram = "RNAfold"
+          if self.pseudoknots:
+              if self.pkprogram == "pKiss":
+                  self.checkForpKiss()
+                  if self.pkparameter == True:
+                      self.alpha = 1.0
+                      self.beta = 0.1
+                      self.ER = 0.2
+                      self.Cstrweight = 0.1
+                      self.Cgcweight = 1.0
+                      self.Cseqweight = 0.5
+                      self.Cseqweight = 50
+                      self.ConvergenceCount = 100
+                      self.usedProgram = "pKiss"
+              elif self.pkprogram == "HotKnots" and self.HotKnots_PATH != "":
+                  self.checkForHotKnots(args)
+                  if self.pkparameter == True:
+                      self.alpha = 1.0
+                      self.beta = 0.1
+                      self.ER = 0.2
+                      self.Cstrweight = 0.1
+                      self.Cgcweight = 1.0
+                      self.Cseqweight = 0.5
+                      self.Cseqweight = 50
+                      self.ConvergenceCount = 100
+                      self.usedProgram = "HotKnots"
+              elif self.pkprogram == "IPKnot":
+                  self.checkForIPKnot()
+                  if self.pkparameter == True:
+                      self.alpha = 1.0
+                      self.beta = 0.1
+                      self.ER = 0.2
+                      self.Cstrweight = 0.1
+                      self.Cgcweight = 1.0
+                      self.Cseqweight = 0.5
+                      self.Cseqweight = 50
+                      self.ConvergenceCount = 100
+                      self.usedProgram = "IPKnot"
+              else:
+                  error = " Please choose a suitable pseudoknot predictor: [pKiss|Hotknots|IPKnot]"
+                  self.error = error
 
         # Constraint Checks and Parsing prior to Execution
         self.checkSimilarLength()
@@ -1835,7 +1840,7 @@ class Variables:
             self.IUPAC_reverseComplements = {"A": "U", "C": "G", "G": "UC", "U": "AG", "R": "UC", "Y": "AG", "S": "UGC",
                                              "W": "UAG", "K": "UCAG", "M": "UG", "B": "AGCU", "D": "AGCU", "H": "UGA", "V": "UGC", "N": "ACGU"}
 
-        for col in xrange(self.noOfColonies):
+        for col in range(self.noOfColonies):
             # Checking the kind of taget GC value should be used
             self.GC = []
             if len(self.tGC) == 1:
@@ -1927,13 +1932,13 @@ class Variables:
         Checking for the presence of the Vienna tools in the system by which'ing for RNAfold and RNAdistance
         """
         RNAfold_output = subprocess.Popen(
-            ["which", "RNAfold"], stdout=subprocess.PIPE).communicate()[0].strip()
+            ["which", "RNAfold"], stdout=subprocess.PIPE, universal_newlines=True).communicate()[0].strip()
         if len(RNAfold_output) > 0 and RNAfold_output.find("found") == -1 and RNAfold_output.find(" no ") == -1:
             return True
         else:
             self.error = "No RNAfold found"
-            print "It seems the Vienna RNA Package is not installed on your machine. Please do so!"
-            print "You can get it at http://www.tbi.univie.ac.at/"
+            print("It seems the Vienna RNA Package is not installed on your machine. Please do so!")
+            print("You can get it at http://www.tbi.univie.ac.at/")
             exit(0)
 
     def checkForpKiss(self):
@@ -1941,14 +1946,14 @@ class Variables:
                 Checking for the presence of pKiss
         """
         pKiss_output = subprocess.Popen(
-            ["which", "pKiss_mfe"], stdout=subprocess.PIPE).communicate()[0].strip()
+            ["which", "pKiss_mfe"], stdout=subprocess.PIPE, universal_newlines=True).communicate()[0].strip()
         #pKiss_output = subprocess.Popen(["which", "/usr/local/pkiss/2014-03-17/bin/pKiss_mfe"], stdout=subprocess.PIPE).communicate()[0].strip()
         if len(pKiss_output) > 0 and pKiss_output.find("found") == -1 and pKiss_output.find(" no ") == -1:
             return True
         else:
             self.error = "No pKiss found"
-            print "It seems that pKiss is not installed on your machine. Please do so!"
-            print "You can get it at http://bibiserv2.cebitec.uni-bielefeld.de/pkiss"
+            print("It seems that pKiss is not installed on your machine. Please do so!")
+            print("You can get it at http://bibiserv2.cebitec.uni-bielefeld.de/pkiss")
             exit(0)
 
     def checkForIPKnot(self):
@@ -1956,13 +1961,13 @@ class Variables:
                 Checking for the presence of IPKnot
         """
         pKiss_output = subprocess.Popen(
-            ["which", "ipknot"], stdout=subprocess.PIPE).communicate()[0].strip()
+            ["which", "ipknot"], stdout=subprocess.PIPE, universal_newlines=True).communicate()[0].strip()
         if len(pKiss_output) > 0 and pKiss_output.find("found") == -1 and pKiss_output.find(" no ") == -1:
             return True
         else:
             self.error = "No IPKnot"
-            print "It seems that IPKnot is not installed on your machine. Please do so!"
-            print "You can get it at http://rtips.dna.bio.keio.ac.jp/ipknot/"
+            print("It seems that IPKnot is not installed on your machine. Please do so!")
+            print("You can get it at http://rtips.dna.bio.keio.ac.jp/ipknot/")
             exit(0)
 
     def checkForHotKnots(self):
@@ -1979,8 +1984,8 @@ class Variables:
             return True
         else:
             self.error = "HotKnots"
-            print "It seems that HotKnots is not installed on your machine. Please do so!"
-            print "You can get it at http://www.cs.ubc.ca/labs/beta/Software/HotKnots/"
+            print("It seems that HotKnots is not installed on your machine. Please do so!")
+            print("You can get it at http://www.cs.ubc.ca/labs/beta/Software/HotKnots/")
             exit(0)
 
 #########################
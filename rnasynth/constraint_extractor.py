@@ -1,7 +1,13 @@
 #!/usr/bin/env python
 
+from collections import OrderedDict
+from itertools import chain
 import logging
 import networkx as nx
+import numpy as np
+
+# Number of extracted constraint sets kept in memory, the least recently used are dropped.
+MAX_CACHED_CONSTRAINTS = 1024
 
 
 class ConstraintExtractor():
@@ -39,6 +45,7 @@ class ConstraintExtractor():
         self.importance_threshold_structure_constraint = importance_threshold_structure_constraint
         self.min_size_connected_component_structure_constraint = min_size_connected_component_structure_constraint
         self.min_size_connected_component_unpaired_structure_constraint = min_size_connected_component_unpaired_structure_constraint
+        self._cache = OrderedDict()
 
     def extract_constraints(self, graphs):
 
@@ -60,180 +67,224 @@ class ConstraintExtractor():
 
          fasta_id : str
              String representing the fasta header of the original sequence
+
+         Constraints are cached per graph content, i.e. sequence, folding and importance
+         scores, and threshold setting.
         """
         for g in graphs:
             fasta_id = g.graph['id']
-            gc_content = self._compute_gc_content(g)
+            labels, scores = self._graph_to_arrays(g)
+            key = self._cache_key(g, labels, scores)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                yield self._cache[key] + (fasta_id,)
+                continue
+            if '_gc_content' not in g.graph:
+                g.graph['_gc_content'] = self._compute_gc_content(labels)
+            gc_content = g.graph['_gc_content']
+            components = None
+            # Shared components are only worth computing if one of the extractions cannot take the fast path.
+            all_important_sequence = self._all_important(scores,
+                                                         self.importance_threshold_sequence_constraint,
+                                                         self.min_size_connected_component_sequence_constraint)
+            all_important_structure = self._all_important(scores,
+                                                          self.importance_threshold_structure_constraint,
+                                                          self.min_size_connected_component_structure_constraint)
+            if self.importance_threshold_sequence_constraint == self.importance_threshold_structure_constraint and \
+                    not (all_important_sequence and all_important_structure):
+                components = self._get_importance_components(g, scores, self.importance_threshold_sequence_constraint)
             cseq = self._extract_sequence_constraints(g,
+                                                      labels,
+                                                      scores,
                                                       self.importance_threshold_sequence_constraint,
-                                                      self.min_size_connected_component_sequence_constraint)
+                                                      self.min_size_connected_component_sequence_constraint,
+                                                      components=components)
             struct = self. _extract_structure_constraints(g,
+                                                          scores,
                                                           self.importance_threshold_structure_constraint,
                                                           self.min_size_connected_component_structure_constraint,
-                                                          self.min_size_connected_component_unpaired_structure_constraint)
+                                                          self.min_size_connected_component_unpaired_structure_constraint,
+                                                          components=components)
+            self._cache[key] = (struct, cseq, gc_content)
+            if len(self._cache) > MAX_CACHED_CONSTRAINTS:
+                self._cache.popitem(last=False)
 
             yield struct, cseq, gc_content, fasta_id
 
+    def clear_cache(self):
+        """
+        Drops all memoized constraints.
+        """
+        self._cache = OrderedDict()
+
+    def _cache_key(self, graph, labels, scores):
+        list_bpairs, paired_set = self._edge_pass(graph)
+        return (''.join(labels.tolist()),
+                tuple(list_bpairs),
+                scores.tobytes(),
+                self.importance_threshold_sequence_constraint,
+                self.min_size_connected_component_sequence_constraint,
+                self.importance_threshold_structure_constraint,
+                self.min_size_connected_component_structure_constraint,
+                self.min_size_connected_component_unpaired_structure_constraint)
+
     def _extract_sequence_constraints(self,
                                       graph,
+                                      labels,
+                                      scores,
                                       importance_threshold_sequence_constraint,
                                       min_size_connected_component_sequence_constraint,
-                                      padding='N'):
+                                      padding='N',
+                                      components=None):
         """
         Generates a sequence constraint string from an annotated Networkx graph.
         Adjacent nodes with the connectivity above the threshold show up
         in the output string as actual nucleotides.
         Other nodes appear as padding in the output string.
+        Precomputed importance components for the same threshold can be passed as components.
         """
-        cstr_dict = self._build_nodes_dict(graph)
+        cstr_list = labels.tolist()
+        if self._all_important(scores,
+                               importance_threshold_sequence_constraint,
+                               min_size_connected_component_sequence_constraint):
+            return ''.join(cstr_list)
         for node in self._get_importance_list(graph,
+                                              scores,
                                               importance_threshold_sequence_constraint,
                                               min_size_connected_component_sequence_constraint,
-                                              importance=-1):
-            cstr_dict[node] = padding
-        cstr = self._dict_to_string(cstr_dict)
+                                              importance=-1,
+                                              components=components):
+            cstr_list[node] = padding
+        cstr = ''.join(cstr_list)
         return cstr
 
     def _extract_structure_constraints(self,
                                        graph,
+                                       scores,
                                        importance_threshold_structure_constraint,
                                        min_size_connected_component_structure_constraint,
-                                       min_size_connected_component_unpaired_structure_constraint):
+                                       min_size_connected_component_unpaired_structure_constraint,
+                                       padding='A',
+                                       components=None):
         """
         Generates a dot-bracket structure constraint string from an annotated Networkx graph.
         Base pairs above the importance threshold appear in the output string.
+        Precomputed importance components for the same threshold can be passed as components.
         """
-        list_bpairs = self._get_basepair_list(graph)
+        list_bpairs, paired_set = self._edge_pass(graph)
         list_unpaired = self._find_unpaired_regions(
-            graph, min_size_connected_component_unpaired_structure_constraint)
-        dic_dot_str = self._build_generic_nodes_dict(graph)
-        importance_list = self._get_importance_list(graph,
-                                                    importance_threshold_structure_constraint,
-                                                    min_size_connected_component_structure_constraint)
-
-        for i, j in list_bpairs:
-            if i in importance_list and j in importance_list:
-                dic_dot_str[i] = '('
-                dic_dot_str[j] = ')'
+            graph, paired_set, min_size_connected_component_unpaired_structure_constraint)
+        dot_str = [padding] * graph.number_of_nodes()
+        if self._all_important(scores,
+                               importance_threshold_structure_constraint,
+                               min_size_connected_component_structure_constraint):
+            important_bpairs = list_bpairs
+        else:
+            importance_set = set(self._get_importance_list(graph,
+                                                           scores,
+                                                           importance_threshold_structure_constraint,
+                                                           min_size_connected_component_structure_constraint,
+                                                           components=components))
+            important_bpairs = [(i, j) for i, j in list_bpairs
+                                if i in importance_set and j in importance_set]
+
+        for i, j in important_bpairs:
+            dot_str[i] = '('
+            dot_str[j] = ')'
         for unpaired_node in list_unpaired:
-            dic_dot_str[unpaired_node] = '.'
-        cstruct = self._dict_to_string(dic_dot_str)
+            dot_str[unpaired_node] = '.'
+        cstruct = ''.join(dot_str)
         return cstruct
 
-    def _dict_to_string(self, dictionary):
-        """
-        Generic function to build a sequential string of dictionary values.
-        """
-        st = ''
-        for i in range(len(dictionary)):
-            st = st + dictionary[i]
-        return st
-
-    def _build_nodes_dict(self, graph):
-        """
-        Builds a dictionary of key = node value = nucleotide out of the graph.
-        """
-        nodes_dict = {}
-        for node, data in graph.nodes_iter(data=True):
-            nodes_dict.update({node: data['label']})
-        return nodes_dict
-
-    def _build_generic_nodes_dict(self, graph, padding='A'):
+    def _graph_to_arrays(self, graph):
         """
-        Builds a dictionary of key = node value = padding out of the graph.
+        Collects the nucleotide labels and importance scores of all nodes in one pass.
+        Returns two arrays indexed by node, nodes are expected to be numbered 0..n-1 along the sequence.
         """
-        nodes_dict = {}
+        n = graph.number_of_nodes()
+        labels = [None] * n
+        scores = [0.0] * n
         for node, data in graph.nodes_iter(data=True):
-            nodes_dict.update({node: padding})
-        return nodes_dict
+            labels[node] = data['label']
+            scores[node] = float(data['importance'])
+        return np.array(labels), np.array(scores)
 
-    def _compute_gc_content(self, graph):
+    def _compute_gc_content(self, labels):
         """
-        Function to calculate the GC content of all subgraphs in a graph set.
+        Function to calculate the GC content of a sequence given its array of nucleotide labels.
         """
-        gc_content = 0
-        for node, data in graph.nodes_iter(data=True):
-            if (data['label'] == 'G') or (data['label'] == 'C'):
-                gc_content += 1
-        gc_content = float(gc_content) / float(nx.number_of_nodes(graph))
+        gc_content = float(np.isin(labels, ['G', 'C']).sum()) / float(labels.size)
         return gc_content
 
-    def _get_basepair_list(self, graph):
+    def _edge_pass(self, graph):
         """
         Accepts single graph as input.
-        Returns a list of all base pairs in the folding.
+        Returns a list of all base pairs in the folding and the set of paired nodes.
+        The result only depends on the folding and is stored on the graph.
         """
+        if '_basepairs' in graph.graph:
+            return graph.graph['_basepairs']
         list_bpairs = []
-        for line in nx.generate_edgelist(graph):
-            if line.find('basepair') > 0:
-                list_bpairs.append(
-                    (int(line.split(' ')[0]), int(line.split(' ')[1])))
-        return list_bpairs
+        paired_set = set()
+        for i, j, data in graph.edges_iter(data=True):
+            if data.get('label') == 'basepair':
+                list_bpairs.append((i, j))
+                paired_set.add(i)
+                paired_set.add(j)
+        graph.graph['_basepairs'] = (list_bpairs, paired_set)
+        return list_bpairs, paired_set
+
+    def _all_important(self, scores, threshold, adjacency):
+        """
+        True when every node passes the threshold and components of any size are accepted,
+        in which case no connected components need to be computed.
+        """
+        return adjacency <= 1 and scores.min() >= threshold
 
-    def _importance_based_graph_cut(self, graph, threshold):
+    def _get_importance_components(self, graph, scores, threshold):
         """
-        Removes nodes with importance below the threshold from g.
+        Returns the connected components formed by nodes with importance above the threshold.
         """
-        for node, data in graph.nodes_iter(data=True):
-            if float(data['importance']) < threshold:
-                graph.remove_node(node)
-        return
+        if scores.min() >= threshold:
+            return list(nx.connected_components(graph))
+        important_nodes = np.nonzero(scores >= threshold)[0].tolist()
+        graph_important = graph.subgraph(important_nodes)
+        return list(nx.connected_components(graph_important))
 
-    def _get_importance_list(self, graph, threshold, adjacency, importance=1):
+    def _get_importance_list(self, graph, scores, threshold, adjacency, importance=1, components=None):
         """
         Generates a list of important nodes in a graph.
         Importance is based on the importance number being greater than threshold,
         and adjacency factor being greater than or equal to radius.
         Returns the complement list if importance = -1.
+        Components already computed for the same threshold are reused when given.
         """
-        graph_c = graph.copy()
-        nodes_list = []
-        self._importance_based_graph_cut(graph_c, threshold)
-        for component in nx.connected_components(graph_c):
+        if components is None:
+            components = self._get_importance_components(graph, scores, threshold)
+        nodes_set = set()
+        for component in components:
             if len(component) >= adjacency:
-                nodes_list = nodes_list + component
+                nodes_set.update(component)
         if importance == 1:
-            importance_list = nodes_list
+            importance_list = list(nodes_set)
         elif importance == -1:
             importance_list = [
-                node for node in graph.nodes() if node not in nodes_list]
+                node for node in graph.nodes_iter() if node not in nodes_set]
         return importance_list
 
-    def _find_paired_nodes(self, graph):
-        """
-        Returns a list containing all paired nodes in a graph.
-        """
-        paired_list = []
-        for line in nx.generate_edgelist(graph):
-            if ('basepair' in line):
-                if not (int(line.split(' ')[0]) in paired_list):
-                    paired_list.append(int(line.split(' ')[0]))
-                if not (int(line.split(' ')[1]) in paired_list):
-                    paired_list.append(int(line.split(' ')[1]))
-        return paired_list
-
-    def _pair_based_graph_cut(self, graph):
-        """
-        Removes paired nodes from graph.
-        """
-        for node in self._find_paired_nodes(graph):
-            graph.remove_node(node)
-        return
-
-    def _find_unpaired_regions(self, graph, adjacency):
+    def _find_unpaired_regions(self, graph, paired_set, adjacency):
         """
-        Generates a list of unpaired nodes in a graph.
+        Generates a list of unpaired nodes in a graph, given the set of paired nodes,
         and adjacency factor being greater than or equal to radius.
         Returns a list containing regions in which the number of unpaired nodes
         is greater than "adjacency".
         """
-        graph_c = graph.copy()
-        unpaired_nodes_list = []
-        self._pair_based_graph_cut(graph_c)
-        for component in nx.connected_components(graph_c):
-            if len(component) >= adjacency:
-                unpaired_nodes_list = unpaired_nodes_list + component
-        return unpaired_nodes_list
+        unpaired_nodes = [node for node in graph.nodes_iter() if node not in paired_set]
+        if adjacency <= 1:
+            return unpaired_nodes
+        graph_unpaired = graph.subgraph(unpaired_nodes)
+        return list(chain.from_iterable(component for component in nx.connected_components(graph_unpaired)
+                                        if len(component) >= adjacency))
 
 
 if __name__ == "__main__":
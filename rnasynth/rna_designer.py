@@ -16,6 +16,9 @@ class AbstractDesigner(object):
     def design(self, constraints=None):
         raise NotImplementedError("Design method not implemented.")
 
+    def design_multi(self, constraints=None, n_designs=1):
+        return [self.design(constraints) for _ in range(n_designs)]
+
 
 class AntaRNAv109Designer(AbstractDesigner):
 
@@ -223,7 +226,7 @@ class AntaRNAv117Designer(AbstractDesigner):
     def __init__(self,
                  Cstr="",
                  Cseq="",
-                 tGC=[],
+                 tGC=None,
                  level=1,
                  tGCmax=-1.0,
                  tGCvar=-1.0,
@@ -258,6 +261,8 @@ class AntaRNAv117Designer(AbstractDesigner):
                  omega=2.23,
                  time=600):
 
+        tGC = [] if tGC is None else tGC
+
         self.designer = antaRNA_v117.AntHill()
         self.designer.params.Cstr = Cstr
         self.designer.params.Cseq = Cseq
@@ -332,6 +337,42 @@ class AntaRNAv117Designer(AbstractDesigner):
             result = r[1].split(":")[1]
         return result
 
+    def design_multi(self, constraints=None, n_designs=1):
+
+        """ Produces several RNA sequences for the same constraint set in a single antaRNA run.
+
+         Every sequence is designed by its own ant colony, the colonies share the RNAfold process.
+
+         Parameters
+         -------
+         constraints : list
+             Containing 3 constraints of structure, sequence, and GC-content respectively
+
+         n_designs : int (default 1)
+             Number of sequences to design
+
+         Returns
+         -------
+         result : list
+              List of n_designs strings containing 'A','U', 'G', and 'C' characters
+        """
+        if n_designs <= 0:
+            return []
+        self.designer.params.Cstr = constraints[0]
+        self.designer.params.Cseq = constraints[1]
+        if type(constraints[2]) == list:
+            self.designer.params.tGC = constraints[2]
+        else:
+            self.designer.params.tGC = [constraints[2]]
+        no_of_colonies = self.designer.params.noOfColonies
+        self.designer.params.noOfColonies = n_designs
+        try:
+            self.designer.params.check()
+            self.designer.swarm()
+        finally:
+            self.designer.params.noOfColonies = no_of_colonies
+        return [r[1].split(":")[1] for r in self.designer.result[-n_designs:]]
+
 
 if __name__ == "__main__":
 
@@ -342,4 +383,4 @@ if __name__ == "__main__":
     designer = AntaRNAv117Designer()
 
     r = designer.design(constraints=constraints)
-    print r
+    print(r)
@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 
 
-from itertools import tee
-from itertools import izip
+from collections import deque
+from itertools import islice
 import logging
+from multiprocessing import cpu_count
+from multiprocessing import Pool
+from joblib import Memory
+import numpy as np
+from scipy.sparse import vstack
 
+from sklearn.base import clone
 from sklearn.linear_model import SGDClassifier
 
-from eden.converter.fasta import fasta_to_sequence
 from eden.converter.rna.rnashapes import rnashapes_to_eden
 from eden.util import fit as optimized_estimator_fit
 from eden.graph import Vectorizer
@@ -21,6 +26,139 @@ from rnasynth.rna_designer import AntaRNAv117Designer
 
 logger = logging.getLogger(__name__)
 
+# antaRNA keeps every result on its AntHill, so worker processes are recycled.
+MAX_DESIGNS_PER_WORKER = 50
+# Bounds the number of constraints extracted ahead of the running designs.
+MAX_PENDING_DESIGNS = 32
+# Number of sequences folded per task when folding in parallel.
+FOLDING_CHUNK_SIZE = 64
+# Number of graphs vectorized and scored together.
+PREDICTION_CHUNK_SIZE = 512
+# The EDeN labels of the positive and the shuffled negative graphs.
+FIT_CLASSES = np.array([-1, 1])
+# Padding characters of the structure and sequence constraints are shown as '-' in headers.
+STRUCTURE_PADDING_TABLE = str.maketrans('A', '-')
+SEQUENCE_PADDING_TABLE = str.maketrans('N', '-')
+
+_worker_designer = None
+
+
+def _n_processes(n_jobs):
+    """
+    Translates an n_jobs value with joblib semantics into a number of processes.
+    """
+    if n_jobs < 0:
+        return max(cpu_count() + 1 + n_jobs, 1)
+    return max(n_jobs, 1)
+
+
+def _bounded_imap(pool, func, iterable, max_pending):
+    """
+    Ordered pool.imap which consumes iterable in the calling thread
+    and keeps at most max_pending tasks in flight.
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _chunks(iterable, size):
+    iterable = iter(iterable)
+    chunk = list(islice(iterable, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterable, size))
+
+
+def _recording(iterable, records):
+    for item in iterable:
+        records.append(item)
+        yield item
+
+
+def _stream_fasta(url):
+    """
+    Yields the (header, sequence) records of a remote FASTA file while it is being downloaded.
+    Only used by __main__, so requests is imported here rather than with the module.
+    """
+    import requests
+    response = requests.get(url, stream=True)
+    response.raise_for_status()
+    # Without a declared charset iter_lines would yield bytes.
+    response.encoding = response.encoding or 'utf-8'
+    header, seq = None, []
+    for line in response.iter_lines(decode_unicode=True):
+        line = line.strip()
+        if line.startswith('>'):
+            if header is not None:
+                yield header, ''.join(seq)
+            header, seq = line[1:].strip(), []
+        elif line:
+            seq.append(line.split()[0])
+    if header is not None:
+        yield header, ''.join(seq)
+
+
+def _minibatches(graphs_pos, graphs_neg, vectorizer, size, negative_ratio):
+    """
+    Vectorizes positive and negative graphs into (X, y) mini-batches of about size graphs,
+    keeping the positive to negative ratio of the training set in every batch.
+    """
+    size_pos = max(1, size // (1 + negative_ratio))
+    batches_pos = _chunks(graphs_pos, size_pos)
+    batches_neg = _chunks(graphs_neg, max(1, size - size_pos))
+    for batch_pos in batches_pos:
+        batch_neg = next(batches_neg, [])
+        X = vectorizer.transform(batch_pos)
+        if batch_neg:
+            X = vstack([X, vectorizer.transform(batch_neg)]).tocsr()
+        y = np.array([1] * len(batch_pos) + [-1] * len(batch_neg))
+        yield X, y
+    for batch_neg in batches_neg:
+        yield vectorizer.transform(batch_neg), np.array([-1] * len(batch_neg))
+
+
+def _fold(seqs, mfe, rnashapes_params, memory=None):
+    if memory is not None:
+        return _fold_cached(seqs, mfe, rnashapes_params, memory)
+    if mfe is False:
+        return rnashapes_to_eden(seqs, **rnashapes_params)
+    return rnafold_to_eden(seqs)
+
+
+def _fold_one(header, seq, mfe, rnashapes_params):
+    return list(_fold([(header, seq)], mfe, rnashapes_params))
+
+
+def _fold_cached(seqs, mfe, rnashapes_params, memory):
+    # The header is part of the key as it becomes the id of the folded graphs.
+    fold_one = memory.cache(_fold_one)
+    for header, seq in seqs:
+        for graph in fold_one(header, seq, mfe, rnashapes_params):
+            yield graph
+
+
+def _fold_worker(task):
+    seqs, mfe, rnashapes_params, memory = task
+    return list(_fold(seqs, mfe, rnashapes_params, memory))
+
+
+def _init_design_worker(designer):
+    global _worker_designer
+    _worker_designer = designer
+
+
+def _design_worker(task):
+    # antaRNA calls exit() on errors, a SystemExit would kill the worker and leave its result pending forever.
+    try:
+        return task, _worker_designer.design_multi(task[:3], task[4])
+    except SystemExit as e:
+        raise RuntimeError('antaRNA exited while designing %s: %s' % (task[3], e))
+
 
 class RNASynthesizerInitializer(object):
 
@@ -52,6 +190,11 @@ class RNASynthesizerInitializer(object):
 
      n_iter_search : int (default 1)
 
+     fit_batch_size : int (default None)
+             If set, the classifier is trained with partial_fit on streamed mini-batches of this
+             many graphs instead of the cross validated search; cv and n_iter_search are then unused.
+             class_weight='auto' is replaced by the equivalent weights for negative_shuffle_ratio.
+
      For parameter description, please refer to :
      https://github.com/scikit-learn/scikit-learn/blob/c957249/sklearn/linear_model/stochastic_gradient.py#L548
 
@@ -162,6 +305,12 @@ class RNASynthesizerInitializer(object):
 
      split_components : bool (default True)
 
+     n_jobs : int (default -1)
+             Number of processes used for folding, shared with the SGDClassifier setting.
+
+     fold_cache : str or joblib.Memory (default None)
+             Directory in which the folded graphs of the input sequences are cached across runs.
+
      For parameter description, please refer to :
      https://github.com/fabriziocosta/EDeN/blob/master/eden/converter/rna/rnashapes.py
 
@@ -187,6 +336,10 @@ class RNASynthesizerInitializer(object):
      negative_shuffle_ratio : int (default 2)
              Number of negative sample sequences generated for each positive sample.
 
+     reuse_fit_graphs : bool (default True)
+             If True, fit_sample designs from the graphs folded during fit instead of folding the
+             sequences a second time.
+
      vectorizer_complexity : int (default 2)
              eden.graph.Vectorizer parameter.
 
@@ -210,6 +363,9 @@ class RNASynthesizerInitializer(object):
      https://github.com/fabriziocosta/EDeN/blob/master/eden/graph.py
     """
 
+    __slots__ = ('constraint_extractor', 'designer', 'pre_processor', 'estimator', 'vectorizer',
+                 'synthesizer')
+
     def __init__(self,
                  # classifier params
                  average=True,
@@ -224,7 +380,7 @@ class RNASynthesizerInitializer(object):
                  # designer
                  Cstr="",
                  Cseq="",
-                 tGC=[],
+                 tGC=None,
                  level=1,
                  tGCmax=-1.0,
                  tGCvar=-1.0,
@@ -274,11 +430,16 @@ class RNASynthesizerInitializer(object):
                  min_r=0,
                  min_d=0,
                  n_jobs=-1,
+                 fold_cache=None,
                  cv=3,
                  n_iter_search=1,
+                 fit_batch_size=None,
+                 reuse_fit_graphs=True,
                  n_synthesized_seqs_per_seed_seq=3
                  ):
 
+        tGC = [] if tGC is None else tGC
+
         self.constraint_extractor = ConstraintExtractor(
             importance_threshold_sequence_constraint=importance_threshold_sequence_constraint,
             min_size_connected_component_sequence_constraint=min_size_connected_component_sequence_constraint,
@@ -326,7 +487,9 @@ class RNASynthesizerInitializer(object):
         self.pre_processor = PreProcessor(shape_type=shape_type,
                                           energy_range=energy_range,
                                           max_num=max_num,
-                                          split_components=split_components)
+                                          split_components=split_components,
+                                          n_jobs=n_jobs,
+                                          memory=fold_cache)
 
         self.estimator = SGDClassifier(average=average,
                                        class_weight=class_weight,
@@ -350,7 +513,9 @@ class RNASynthesizerInitializer(object):
                                     negative_shuffle_ratio=negative_shuffle_ratio,
                                     n_jobs=n_jobs,
                                     cv=cv,
-                                    n_iter_search=n_iter_search)
+                                    n_iter_search=n_iter_search,
+                                    fit_batch_size=fit_batch_size,
+                                    reuse_fit_graphs=reuse_fit_graphs)
         logger.debug('Created a RNASynthesizer object.')
 
     def init_synthesizer(self):
@@ -359,38 +524,65 @@ class RNASynthesizerInitializer(object):
 
 class PreProcessor(object):
 
+    __slots__ = ('shape_type', 'energy_range', 'max_num', 'split_components', 'n_jobs', 'memory')
+
     def __init__(self,
                  shape_type=5,
                  energy_range=35,
                  max_num=3,
-                 split_components=True
+                 split_components=True,
+                 n_jobs=1,
+                 memory=None
                  ):
         self.shape_type = shape_type
         self.energy_range = energy_range
         self.max_num = max_num
         self.split_components = split_components
+        self.n_jobs = n_jobs
+        if isinstance(memory, str):
+            memory = Memory(memory, compress=3, verbose=0)
+        self.memory = memory
         logger.debug('Created a PreProcessor object.')
 
-    def transform(self, seqs=None, mfe=False):
-        if mfe is False:
-            graphs = rnashapes_to_eden(seqs,
-                                       shape_type=self.shape_type,
-                                       energy_range=self.energy_range,
-                                       max_num=self.max_num,
-                                       split_components=self.split_components)
-        else:
-            graphs = rnafold_to_eden(seqs)
-        return graphs
+    def _rnashapes_params(self):
+        return dict(shape_type=self.shape_type,
+                    energy_range=self.energy_range,
+                    max_num=self.max_num,
+                    split_components=self.split_components)
+
+    def transform(self, seqs=None, mfe=False, use_cache=True):
+        memory = self.memory if use_cache else None
+        n_processes = _n_processes(self.n_jobs)
+        if n_processes == 1:
+            return _fold(seqs, mfe, self._rnashapes_params(), memory)
+        return self._transform_parallel(seqs, mfe, n_processes, memory)
+
+    def _transform_parallel(self, seqs, mfe, n_processes, memory):
+        rnashapes_params = self._rnashapes_params()
+        tasks = ((chunk, mfe, rnashapes_params, memory) for chunk in _chunks(seqs, FOLDING_CHUNK_SIZE))
+        pool = Pool(processes=n_processes)
+        try:
+            for graphs in _bounded_imap(pool, _fold_worker, tasks, 2 * n_processes):
+                for graph in graphs:
+                    yield graph
+        finally:
+            pool.terminate()
 
 
 class RNASynth(object):
 
+    __slots__ = ('estimator', 'vectorizer', 'designer', 'pre_processor', 'constraint_extractor',
+                 '_n_synthesized_seqs_per_seed_seq', '_instance_score_threshold_in',
+                 '_instance_score_threshold_out', '_shuffle_order', '_negative_shuffle_ratio',
+                 '_n_jobs', '_cv', '_n_iter_search', '_fit_batch_size', '_reuse_fit_graphs',
+                 '_coef32')
+
     def __init__(self,
-                 estimator=SGDClassifier(),
-                 vectorizer=Vectorizer(),
-                 pre_processor=PreProcessor(),
-                 designer=AntaRNAv117Designer(),
-                 constraint_extractor=ConstraintExtractor(),
+                 estimator=None,
+                 vectorizer=None,
+                 pre_processor=None,
+                 designer=None,
+                 constraint_extractor=None,
                  n_synthesized_seqs_per_seed_seq=3,
                  instance_score_threshold_in=0,
                  instance_score_threshold_out=1,
@@ -398,14 +590,16 @@ class RNASynth(object):
                  negative_shuffle_ratio=2,
                  n_jobs=-1,
                  cv=3,
-                 n_iter_search=1
+                 n_iter_search=1,
+                 fit_batch_size=None,
+                 reuse_fit_graphs=True
                  ):
 
-        self.estimator = estimator
-        self.vectorizer = vectorizer
-        self.designer = designer
-        self.pre_processor = pre_processor
-        self.constraint_extractor = constraint_extractor
+        self.estimator = SGDClassifier() if estimator is None else estimator
+        self.vectorizer = Vectorizer() if vectorizer is None else vectorizer
+        self.designer = AntaRNAv117Designer() if designer is None else designer
+        self.pre_processor = PreProcessor() if pre_processor is None else pre_processor
+        self.constraint_extractor = ConstraintExtractor() if constraint_extractor is None else constraint_extractor
 
         self._n_synthesized_seqs_per_seed_seq = n_synthesized_seqs_per_seed_seq
         self._instance_score_threshold_in = instance_score_threshold_in
@@ -415,9 +609,18 @@ class RNASynth(object):
         self._n_jobs = n_jobs
         self._cv = cv
         self._n_iter_search = n_iter_search
+        self._fit_batch_size = fit_batch_size
+        self._reuse_fit_graphs = reuse_fit_graphs
+        self._coef32 = None
 
         logger.debug('Instantiated an RNASynth object.')
-        logger.debug(self.__dict__)
+        logger.debug('n_synthesized_seqs_per_seed_seq: %s, instance_score_threshold_in: %s, '
+                     'instance_score_threshold_out: %s, shuffle_order: %s, negative_shuffle_ratio: %s, '
+                     'n_jobs: %s, cv: %s, n_iter_search: %s, fit_batch_size: %s, reuse_fit_graphs: %s',
+                     self._n_synthesized_seqs_per_seed_seq, self._instance_score_threshold_in,
+                     self._instance_score_threshold_out, self._shuffle_order, self._negative_shuffle_ratio,
+                     self._n_jobs, self._cv, self._n_iter_search, self._fit_batch_size,
+                     self._reuse_fit_graphs)
 
     def __repr__(self):
         obj_str = 'RNASynth:\n'
@@ -429,71 +632,148 @@ class RNASynth(object):
                                      seqs=None,
                                      negative_shuffle_ratio=None,
                                      shuffle_order=None):
-        seqs, seqs_ = tee(seqs)
-        graphs = self.pre_processor.transform(seqs, mfe=False)
-        seqs_neg = seq_to_seq(seqs_,
+        # The sequences are recorded as they are folded, so folding starts before seqs is exhausted.
+        seqs_pos = []
+        graphs = list(self.pre_processor.transform(_recording(seqs, seqs_pos), mfe=False))
+        seqs_neg = seq_to_seq(seqs_pos,
                               modifier=shuffle_modifier,
                               times=negative_shuffle_ratio,
                               order=shuffle_order)
-        graphs_neg = self.pre_processor.transform(seqs_neg)
+        # The shuffled negatives differ on every fit, caching their folds would never pay off.
+        graphs_neg = self.pre_processor.transform(seqs_neg, use_cache=False)
         return graphs, graphs_neg
 
     def fit(self, seqs):
+        self._fit(seqs)
+        return self
+
+    def _fit(self, seqs):
+        # Returns the positive graphs, which only fit_sample keeps for sampling.
+        self.constraint_extractor.clear_cache()
+        self._coef32 = None
         graphs, graphs_neg = self._binary_classification_setup(
             seqs=seqs,
             negative_shuffle_ratio=self._negative_shuffle_ratio,
             shuffle_order=self._shuffle_order)
-        self.estimator = optimized_estimator_fit(graphs,
-                                                 graphs_neg,
-                                                 self.vectorizer,
-                                                 n_jobs=self._n_jobs,
-                                                 cv=self._cv,
-                                                 n_iter_search=self._n_iter_search)
-        return self
+        if self._fit_batch_size:
+            self._partial_fit(graphs, graphs_neg)
+        else:
+            self.estimator = optimized_estimator_fit(graphs,
+                                                     graphs_neg,
+                                                     self.vectorizer,
+                                                     n_jobs=self._n_jobs,
+                                                     cv=self._cv,
+                                                     n_iter_search=self._n_iter_search)
+        return graphs
+
+    def _partial_fit(self, graphs, graphs_neg):
+        # A fresh estimator, as partial_fit would otherwise continue training the previous model.
+        self.estimator = clone(self.estimator)
+        if self.estimator.get_params().get('class_weight') in ('auto', 'balanced'):
+            # partial_fit rejects class weights computed from the data, the class ratio is known upfront.
+            ratio = float(self._negative_shuffle_ratio)
+            self.estimator.set_params(class_weight={1: (1 + ratio) / 2, -1: (1 + ratio) / (2 * ratio)})
+        # The negative graphs are folded and vectorized batch by batch, never as a single matrix.
+        for X, y in _minibatches(graphs, graphs_neg, self.vectorizer,
+                                 self._fit_batch_size, self._negative_shuffle_ratio):
+            self.estimator.partial_fit(X, y, classes=FIT_CLASSES)
 
     def _design(self, graphs):
+        if self._n_synthesized_seqs_per_seed_seq <= 0:
+            return iter([])
         graphs = self.vectorizer.annotate(graphs, estimator=self.estimator)
         iterable = self.constraint_extractor.extract_constraints(graphs)
-        for (dot_bracket, seq_constraint, gc_content, fasta_id) in iterable:
-            for count in range(self._n_synthesized_seqs_per_seed_seq):
-                sequence = self.designer.design((dot_bracket, seq_constraint, gc_content))
-                header = fasta_id + ';' + str(count) + ';' +\
-                    dot_bracket.replace('A', '-') + ';' +\
-                    seq_constraint.replace('N', '-')
+        # All the sequences of a constraint are designed by one multi-colony antaRNA run.
+        tasks = ((dot_bracket, seq_constraint, gc_content, fasta_id, self._n_synthesized_seqs_per_seed_seq)
+                 for (dot_bracket, seq_constraint, gc_content, fasta_id) in iterable)
+        n_processes = _n_processes(self._n_jobs)
+        if n_processes == 1:
+            results = ((task, self.designer.design_multi(task[:3], task[4])) for task in tasks)
+            return self._design_headers(results)
+        return self._design_parallel(tasks, n_processes)
+
+    def _design_parallel(self, tasks, n_processes):
+        pool = Pool(processes=n_processes,
+                    initializer=_init_design_worker,
+                    initargs=(self.designer,),
+                    maxtasksperchild=max(1, MAX_DESIGNS_PER_WORKER // self._n_synthesized_seqs_per_seed_seq))
+        try:
+            results = _bounded_imap(pool, _design_worker, tasks, max(MAX_PENDING_DESIGNS, 2 * n_processes))
+            for header, sequence in self._design_headers(results):
                 yield header, sequence
+        finally:
+            pool.terminate()
+
+    def _design_headers(self, results):
+        for (dot_bracket, seq_constraint, gc_content, fasta_id, n_designs), sequences in results:
+            dot_bracket = dot_bracket.translate(STRUCTURE_PADDING_TABLE)
+            seq_constraint = seq_constraint.translate(SEQUENCE_PADDING_TABLE)
+            for count, sequence in enumerate(sequences):
+                header = '%s;%d;%s;%s' % (fasta_id, count, dot_bracket, seq_constraint)
+                yield header, sequence
+
+    def _decision_function(self, graphs):
+        X = self.vectorizer.transform(graphs)
+        coef = getattr(self.estimator, 'coef_', None)
+        if coef is None or coef.shape[0] != 1:
+            return self.estimator.decision_function(X)
+        return self._predict_fast(X)
+
+    def _predict_fast(self, X):
+        """
+        Linear decision function in single precision, used where scores are only thresholded.
+        """
+        if self._coef32 is None:
+            self._coef32 = (self.estimator.coef_.ravel().astype(np.float32),
+                            np.float32(self.estimator.intercept_[0]))
+        coef, intercept = self._coef32
+        return X.astype(np.float32).dot(coef) + intercept
 
     def _filter_graphs(self, graphs):
-        graphs, graphs_ = tee(graphs)
-        predictions = self.vectorizer.predict(graphs, self.estimator)
-        for prediction, graph in izip(predictions, graphs_):
-            if prediction > self._instance_score_threshold_in:
-                yield graph
+        threshold = self._instance_score_threshold_in
+        for chunk in _chunks(graphs, PREDICTION_CHUNK_SIZE):
+            predictions = self._decision_function(chunk)
+            for i in np.nonzero(predictions > threshold)[0]:
+                yield chunk[i]
 
     def _filter_seqs(self, seqs):
-        seqs, seqs_ = tee(seqs)
-        graphs = self.pre_processor.transform(seqs, mfe=True)
-        predictions = self.vectorizer.predict(graphs, self.estimator)
-        for prediction, seq in izip(predictions, seqs_):
-            if prediction > self._instance_score_threshold_out:
-                yield seq
-
-    def sample(self, seqs):
-        graphs = self.pre_processor.transform(seqs, mfe=False)
+        threshold = self._instance_score_threshold_out
+        # One transform folds the whole stream; the mfe folding yields one graph per sequence, in order.
+        pending = deque()
+        # Every design has its own header so cached folds would never be read back.
+        graphs = self.pre_processor.transform(_recording(seqs, pending), mfe=True, use_cache=False)
+        for chunk in _chunks(graphs, PREDICTION_CHUNK_SIZE):
+            seqs_chunk = [pending.popleft() for _ in chunk]
+            predictions = self._decision_function(chunk)
+            for i in np.nonzero(predictions > threshold)[0]:
+                yield seqs_chunk[i]
+
+    def sample(self, seqs=None, _graphs=None):
+        if _graphs is not None:
+            graphs = _graphs
+        else:
+            graphs = self.pre_processor.transform(seqs, mfe=False)
         graphs = self._filter_graphs(graphs)
         seqs = self._design(graphs)
         seqs = self._filter_seqs(seqs)
         return seqs
 
     def fit_sample(self, seqs):
-        seqs, seqs_ = tee(seqs)
-        seqs = self.fit(seqs).sample(seqs_)
+        if not self._reuse_fit_graphs:
+            seqs = list(seqs)
+        graphs = self._fit(seqs)
+        if not self._reuse_fit_graphs:
+            return self.sample(seqs)
+        # Sample from the positive graphs folded during fit instead of folding seqs again.
+        seqs = self.sample(_graphs=graphs)
         return seqs
 
     def predict(self, seqs):
         graphs = self.pre_processor.transform(seqs, mfe=True)
-        predictions = self.vectorizer.predict(graphs, self.estimator)
-        for prediction in predictions:
-            yield prediction
+        for chunk in _chunks(graphs, PREDICTION_CHUNK_SIZE):
+            # The scores are returned to the caller, so they keep the estimator's own precision.
+            for prediction in self.estimator.decision_function(self.vectorizer.transform(chunk)):
+                yield prediction
 
 
 if __name__ == "__main__":
@@ -502,10 +782,10 @@ if __name__ == "__main__":
     logger.info('Call to RNASynthesizer module.')
 
     rfam_id = 'RF01685'
-    iterable_seq = fasta_to_sequence(
+    iterable_seq = _stream_fasta(
         'http://rfam.xfam.org/family/%s/alignment?acc=%s&format=fastau&download=0' % (rfam_id, rfam_id))
     synthesizer = RNASynthesizerInitializer().synthesizer
     synth_seqs = synthesizer.fit_sample(iterable_seq)
     for header, seq in synth_seqs:
-        print header
-        print seq
+        print(header)
+        print(seq)